@@ -94,7 +94,7 @@ if [ "$MODE" == "build" ] && [ -n "$WEEK" ]; then
     LLM_SUMMARY_FILE="$SUMMARY_SRC_DIR/${YEAR}-week${WEEK}_llm_summary.md"
     if [ ! -f "$LLM_SUMMARY_FILE" ]; then
         echo "--- LLM Summary for Week $WEEK not found, generating... ---"
-        uv run python3 -m ff.llm_report --week $WEEK --year $YEAR --llm-provider $LLM_PROVIDER
+        uv run --extra llm python3 -m ff.llm_report --week $WEEK --year $YEAR --llm-provider $LLM_PROVIDER
     else
         echo "--- LLM Summary for Week $WEEK already exists. ---"
     fi
@@ -124,7 +124,7 @@ if [ -d "$SUMMARY_SRC_DIR" ] && [ "$(ls -A "$SUMMARY_SRC_DIR")" ]; then
                     html_filename=$(basename "${md_file%.md}.html")
                     html_filepath="$DEST_DIR/reports/summaries/$html_filename"
                     link_text=$html_filename
-                    uv run python3 -m ff.build_summary "$md_file" "$link_text" > "$html_filepath"
+                    uv run --extra llm python3 -m ff.build_summary "$md_file" "$link_text" > "$html_filepath"
                     SUMMARY_LINKS_HTML="${SUMMARY_LINKS_HTML}<li><a href='summaries/$html_filename'>${link_text}</a></li>"
                 done
             fi
@@ -133,7 +133,7 @@ if [ -d "$SUMMARY_SRC_DIR" ] && [ "$(ls -A "$SUMMARY_SRC_DIR")" ]; then
                 html_filename="prompt.html"
                 html_filepath="$DEST_DIR/reports/summaries/$html_filename"
                 link_text="prompt.txt"
-                uv run python3 -m ff.build_summary "prompt.txt" "$link_text" > "$html_filepath"
+                uv run --extra llm python3 -m ff.build_summary "prompt.txt" "$link_text" > "$html_filepath"
                 SUMMARY_LINKS_HTML="${SUMMARY_LINKS_HTML}<li><a href='summaries/$html_filename'>${link_text}</a></li>"
             fi
 
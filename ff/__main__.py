@@ -49,9 +49,15 @@ def cli(verbose):
     default=False,
     help="Force overwrite of existing report",
 )
-def weekly(year, week, output, force):
+@click.option(
+    "--refresh-logos",
+    is_flag=True,
+    default=False,
+    help="Revalidate cached team logos and re-download any that changed",
+)
+def weekly(year, week, output, force, refresh_logos):
     """Generate a weekly fantasy football report."""
-    report = WeeklyReport(year=year)
+    report = WeeklyReport(year=year, refresh_logos=refresh_logos)
 
     # Use current week if week is 0
     effective_week = week
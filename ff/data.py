@@ -1,6 +1,9 @@
+import copy
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import cached_property
 from pathlib import Path
 
 from espn_api.football import League
@@ -25,6 +28,38 @@ class LeagueData:
             fetch_league=True,
         )
 
+    def __getstate__(self):
+        # Keep the private-league cookies out of pickled (on-disk) copies;
+        # __setstate__ supplies the current ones again on load
+        state = self.__dict__.copy()
+        league = copy.copy(self.league)
+        league.espn_request = copy.copy(self.league.espn_request)
+        league.espn_request.cookies = None
+        state["league"] = league
+        return state
+
+    def __setstate__(self, state):
+        # Pickled instances carry no cookies; use the current credentials so
+        # requests made through a cached copy still authenticate
+        self.__dict__.update(state)
+        self.league.espn_request.cookies = (
+            {"espn_s2": ESPN_S2, "SWID": SWID} if ESPN_S2 and SWID else None
+        )
+
+    @cached_property
+    def teams_by_abbrev(self):
+        """Map of team abbreviation to Team object
+
+        The league's teams are fixed once fetched, so this is built once per
+        LeagueData instance.
+        """
+        return {team.team_abbrev: team for team in self.league.teams}
+
+    @cached_property
+    def teams_by_name(self):
+        """Map of team name to Team object"""
+        return {team.team_name: team for team in self.league.teams}
+
     def get_current_week(self):
         """Get the current fantasy football week"""
         return self.league.current_week
@@ -50,6 +85,24 @@ class LeagueData:
             return self.league.box_scores(week)
         return self.league.box_scores()
 
+    def get_box_scores_for_weeks(self, weeks, max_workers=8):
+        """Get box scores for several weeks, fetching them concurrently
+
+        Each week is a separate ESPN request, so the requests are issued in
+        parallel rather than one after another.
+
+        Args:
+            weeks: Iterable of week numbers
+
+        Returns:
+            List of box score lists, in the same order as weeks
+        """
+        weeks = list(weeks)
+        if not weeks:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(weeks))) as executor:
+            return list(executor.map(self.get_box_scores, weeks))
+
     def get_power_rankings(self, week=None):
         """Get power rankings for the specified week
 
@@ -2,16 +2,24 @@
 This script gathers fantasy football data, formats it, and uses an LLM to generate a report.
 """
 
+import asyncio
+import contextlib
+import functools
+import hashlib
+import importlib.metadata
+import io
+import json
 import os
+import pickle
 import re
-import glob
+import sys
 import logging  # Added logging
 import time  # Added time for timing
 import datetime  # Added datetime for timestamps
 import argparse  # Added argparse
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from dotenv import load_dotenv
-import openai
-from google import genai
 from ff.game_summary import generate_summary, generate_simplified_summary
 from ff.data import LeagueData
 from ff.config import LEAGUE_YEAR
@@ -23,188 +31,922 @@ logging.basicConfig(
 
 # --- LLM Provider Abstraction ---
 
+# How often to check on a submitted batch job
+BATCH_POLL_SECONDS = 30
+
+
+@functools.lru_cache(maxsize=1)
+def _http_client():
+    # Shared keep-alive pool so repeated OpenAI calls reuse TLS connections.
+    # DefaultHttpxClient keeps the SDK's own timeout, redirect and connection
+    # limit defaults. Created on first use so other providers skip the import.
+    import openai
+
+    return openai.DefaultHttpxClient()
+
+
+@functools.lru_cache(maxsize=4)
+def _build_user_content(current: str, historical: str) -> str:
+    # Cached so providers rendering the same prompt data share one copy of
+    # the (potentially very large) combined string
+    return (
+        f"## Current Week Data\n\n{current}\n\n"
+        f"## Historical Data\n\n{historical}"
+    )
+
+
+def build_prompt_messages(prompt_data: dict) -> tuple[str, str]:
+    """Returns the (system prompt, user content) pair sent to every provider."""
+    system_prompt = prompt_data.get("system", "You are a helpful assistant.")
+    user_content = _build_user_content(
+        prompt_data.get("current", ""), prompt_data.get("historical", "")
+    )
+    return system_prompt, user_content
+
+
+class LLMReportError(Exception):
+    """Raised when a provider fails to generate a (complete) report."""
+
 
 class LLMProvider:
     """Abstract base class for LLM providers."""
 
-    def generate_report(self, prompt_data: dict) -> str:
-        """Generates a report based on the provided prompt data."""
+    def validate(self) -> bool:
+        """
+        Checks the provider's credentials with a cheap API call.
+
+        Run before gathering data so a bad key fails in seconds rather than
+        after the (slow) ESPN fetches.
+        """
+        return True
+
+    def generate_report(self, prompt_data: dict, model: str | None = None) -> str:
+        """
+        Generates a report based on the provided prompt data.
+
+        `model` overrides the provider's default model for this call.
+        Raises LLMReportError if the provider call fails.
+        """
+        raise NotImplementedError
+
+    async def generate_report_async(self, prompt_data: dict) -> str:
+        """Generates a report without blocking the event loop."""
+        raise NotImplementedError
+
+    def stream_report(self, prompt_data: dict, sink) -> str:
+        """
+        Generates a report, writing it to `sink` as it arrives.
+
+        Returns the full report text. Providers without streaming support
+        write the whole report once it is complete. Raises LLMReportError if
+        the stream fails, after any partial text has been written.
+        """
+        report = self.generate_report(prompt_data)
+        sink.write(report)
+        return report
+
+    def generate_batch(
+        self, prompts: dict[str, dict], poll_interval: int = BATCH_POLL_SECONDS
+    ) -> dict[str, str | LLMReportError]:
+        """
+        Generates reports for many prompts through the provider's Batch API.
+
+        Batch jobs run asynchronously on the provider side at a reduced price,
+        so this blocks, polling every `poll_interval` seconds, until the job
+        finishes. Returns a mapping of prompt key to report text, or to an
+        LLMReportError for prompts that failed.
+        """
         raise NotImplementedError
 
 
 class OpenAIProvider(LLMProvider):
     """An implementation of LLMProvider for OpenAI models."""
 
-    def __init__(self, api_key: str, model: str = "gpt-4o"):
-        self.client = openai.OpenAI(api_key=api_key)
+    def __init__(
+        self, api_key: str, model: str = "gpt-4o", cheap_model: str = "gpt-4o-mini"
+    ):
+        # Imported here so only the selected provider's SDK is loaded
+        import openai
+
+        self.client = openai.OpenAI(api_key=api_key, http_client=_http_client())
+        # The OpenAI client retries rate limits with exponential backoff
+        self.aclient = openai.AsyncOpenAI(api_key=api_key, max_retries=5)
         self.model = model
+        self.cheap_model = cheap_model
 
-    def generate_report(self, prompt_data: dict) -> str:
-        """
-        Generates a report using the OpenAI API.
-        """
-        logging.info("LLM API call is enabled.")
+    def validate(self) -> bool:
+        try:
+            self.client.models.list()
+            return True
+        except Exception as e:
+            logging.error(f"OpenAI credential check failed: {e}")
+            return False
 
-        system_prompt = prompt_data.get("system", "You are a helpful assistant.")
-        user_content = (
-            f"## Current Week Data\n\n{prompt_data.get('current', '')}\n\n"
-            f"## Historical Data\n\n{prompt_data.get('historical', '')}"
-        )
+    def _build_messages(self, prompt_data: dict) -> list:
+        system_prompt, user_content = build_prompt_messages(prompt_data)
 
-        messages = [
+        return [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_content},
         ]
 
+    def generate_report(self, prompt_data: dict, model: str | None = None) -> str:
+        """
+        Generates a report using the OpenAI API.
+        """
+        logging.info("LLM API call is enabled.")
+
+        messages = self._build_messages(prompt_data)
+
         try:
             response = self.client.chat.completions.create(
+                model=model or self.model, messages=messages
+            )
+            return response.choices[0].message.content
+        except Exception as e:
+            raise LLMReportError(f"Error generating report from OpenAI: {e}") from e
+
+    def stream_report(self, prompt_data: dict, sink) -> str:
+        """
+        Generates a report using the OpenAI API, streaming it to sink.
+        """
+        logging.info("LLM API call is enabled.")
+
+        messages = self._build_messages(prompt_data)
+
+        parts = []
+        try:
+            stream = self.client.chat.completions.create(
+                model=self.model, messages=messages, stream=True
+            )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                text = chunk.choices[0].delta.content or ""
+                if text:
+                    sink.write(text)
+                    parts.append(text)
+        except Exception as e:
+            raise LLMReportError(f"Error generating report from OpenAI: {e}") from e
+        return "".join(parts)
+
+    async def generate_report_async(self, prompt_data: dict) -> str:
+        """
+        Generates a report using the async OpenAI client.
+        """
+        messages = self._build_messages(prompt_data)
+
+        try:
+            response = await self.aclient.chat.completions.create(
                 model=self.model, messages=messages
             )
             return response.choices[0].message.content
         except Exception as e:
-            return f"Error generating report from OpenAI: {e}"
+            raise LLMReportError(f"Error generating report from OpenAI: {e}") from e
+
+    def generate_batch(
+        self, prompts: dict[str, dict], poll_interval: int = BATCH_POLL_SECONDS
+    ) -> dict[str, str | LLMReportError]:
+        """
+        Generates reports using the OpenAI Batch API.
+        """
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": key,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "messages": self._build_messages(prompt_data),
+                    },
+                }
+            )
+            for key, prompt_data in prompts.items()
+        ]
+        batch_input = self.client.files.create(
+            file=("batch_input.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        logging.info(f"Submitted OpenAI batch {batch.id} with {len(lines)} requests.")
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.client.batches.retrieve(batch.id)
+            logging.info(f"OpenAI batch {batch.id} status: {batch.status}")
+
+        if batch.status != "completed":
+            raise RuntimeError(f"OpenAI batch {batch.id} ended as {batch.status}")
+
+        results = {}
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                response = result.get("response") or {}
+                if response.get("status_code") == 200:
+                    body = response["body"]
+                    results[result["custom_id"]] = body["choices"][0]["message"][
+                        "content"
+                    ]
+                else:
+                    results[result["custom_id"]] = LLMReportError(
+                        "Error generating report from OpenAI: "
+                        f"{result.get('error') or response}"
+                    )
+        for key in prompts.keys() - results.keys():
+            results[key] = LLMReportError(
+                "Error generating report from OpenAI: no batch result"
+            )
+        return results
 
 
 class GeminiProvider(LLMProvider):
     """An implementation of LLMProvider for Google Gemini models."""
 
-    def __init__(self, api_key: str, model: str = "gemini-2.5-flash"):
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-2.5-flash",
+        cheap_model: str = "gemini-2.5-flash-lite",
+    ):
+        # Imported here so only the selected provider's SDK is loaded
+        from google import genai
+
         self.client = genai.Client(api_key=api_key)
         self.model = model
+        self.cheap_model = cheap_model
 
-    def generate_report(self, prompt_data: dict) -> str:
-        """
-        Generates a report using the Google Gemini API.
-        """
-        logging.info("Gemini API call is enabled.")
+    def validate(self) -> bool:
+        try:
+            self.client.models.list(config={"page_size": 1})
+            return True
+        except Exception as e:
+            logging.error(f"Gemini credential check failed: {e}")
+            return False
 
-        system_prompt = prompt_data.get("system", "You are a helpful assistant.")
-        user_content = (
-            f"## Current Week Data\n\n{prompt_data.get('current', '')}\n\n"
-            f"## Historical Data\n\n{prompt_data.get('historical', '')}"
-        )
+    def _build_contents(self, prompt_data: dict) -> list:
+        system_prompt, user_content = build_prompt_messages(prompt_data)
 
         # The new API uses a different structure for messages
-        contents = [
+        return [
             system_prompt,
             "Okay, I understand. How can I help?",
             user_content,
         ]
 
+    def generate_report(self, prompt_data: dict, model: str | None = None) -> str:
+        """
+        Generates a report using the Google Gemini API.
+        """
+        logging.info("Gemini API call is enabled.")
+
+        contents = self._build_contents(prompt_data)
+
         try:
             response = self.client.models.generate_content(
+                model=model or self.model,
+                contents=contents,
+            )
+            return response.text
+        except Exception as e:
+            raise LLMReportError(f"Error generating report from Gemini: {e}") from e
+
+    def stream_report(self, prompt_data: dict, sink) -> str:
+        """
+        Generates a report using the Google Gemini API, streaming it to sink.
+        """
+        logging.info("Gemini API call is enabled.")
+
+        contents = self._build_contents(prompt_data)
+
+        parts = []
+        try:
+            for chunk in self.client.models.generate_content_stream(
+                model=self.model,
+                contents=contents,
+            ):
+                text = chunk.text or ""
+                if text:
+                    sink.write(text)
+                    parts.append(text)
+        except Exception as e:
+            raise LLMReportError(f"Error generating report from Gemini: {e}") from e
+        return "".join(parts)
+
+    async def generate_report_async(self, prompt_data: dict) -> str:
+        """
+        Generates a report using the async Google Gemini client.
+        """
+        contents = self._build_contents(prompt_data)
+
+        try:
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=contents,
             )
             return response.text
         except Exception as e:
-            return f"Error generating report from Gemini: {e}"
+            raise LLMReportError(f"Error generating report from Gemini: {e}") from e
+
+    def generate_batch(
+        self, prompts: dict[str, dict], poll_interval: int = BATCH_POLL_SECONDS
+    ) -> dict[str, str | LLMReportError]:
+        """
+        Generates reports using the Gemini Batch API with inline requests.
+        """
+        keys = list(prompts)
+        inline_requests = [
+            {
+                "contents": [
+                    {
+                        "role": "user",
+                        "parts": [
+                            {"text": text}
+                            for text in self._build_contents(prompts[key])
+                        ],
+                    }
+                ]
+            }
+            for key in keys
+        ]
+        batch_job = self.client.batches.create(
+            model=self.model,
+            src=inline_requests,
+            config={"display_name": "ff-report-llm-summaries"},
+        )
+        logging.info(
+            f"Submitted Gemini batch {batch_job.name} with {len(keys)} requests."
+        )
+
+        finished_states = {
+            "JOB_STATE_SUCCEEDED",
+            "JOB_STATE_FAILED",
+            "JOB_STATE_CANCELLED",
+            "JOB_STATE_EXPIRED",
+        }
+        while batch_job.state.name not in finished_states:
+            time.sleep(poll_interval)
+            batch_job = self.client.batches.get(name=batch_job.name)
+            logging.info(f"Gemini batch {batch_job.name} state: {batch_job.state.name}")
+
+        if batch_job.state.name != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(
+                f"Gemini batch {batch_job.name} ended as {batch_job.state.name}"
+            )
+
+        results = {}
+        for key, inline_response in zip(keys, batch_job.dest.inlined_responses):
+            if inline_response.response:
+                results[key] = inline_response.response.text
+            else:
+                results[key] = LLMReportError(
+                    f"Error generating report from Gemini: {inline_response.error}"
+                )
+        return results
+
+
+async def generate_reports(
+    provider: LLMProvider, prompts: list[dict], concurrency: int | None = None
+) -> list[str]:
+    """
+    Generates several reports concurrently, in the same order as prompts.
+
+    At most `concurrency` requests (default: LLM_CONCURRENCY env var, or 5)
+    are in flight at once to stay within provider rate limits.
+    """
+    if concurrency is None:
+        concurrency = int(os.getenv("LLM_CONCURRENCY", "5"))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def generate(prompt_data):
+        async with semaphore:
+            return await provider.generate_report_async(prompt_data)
+
+    return await asyncio.gather(*(generate(prompt_data) for prompt_data in prompts))
+
+
+# Marks an independent section of the report in the system prompt
+_SECTION_RE = re.compile(r"^## Section:.*$", re.MULTILINE)
+
+
+def split_prompt_sections(prompt_data: dict) -> list[dict]:
+    """
+    Splits prompt data into one variant per `## Section:` in the system prompt.
+
+    Text before the first marker is shared by every section. Prompts with
+    fewer than two sections are returned unchanged as a single item.
+    """
+    system_prompt = prompt_data.get("system", "")
+    starts = [m.start() for m in _SECTION_RE.finditer(system_prompt)]
+    if len(starts) < 2:
+        return [prompt_data]
+
+    preamble = system_prompt[: starts[0]].strip()
+    variants = []
+    for start, end in zip(starts, starts[1:] + [len(system_prompt)]):
+        section = system_prompt[start:end].strip()
+        scoped = f"{section}\n\nWrite only this section of the report."
+        variants.append(
+            {**prompt_data, "system": f"{preamble}\n\n{scoped}" if preamble else scoped}
+        )
+    return variants
+
+
+async def generate_sectioned_report(provider: LLMProvider, prompt_data: dict) -> str:
+    """
+    Generates each section of a report concurrently and joins them in order.
+
+    Sections are independent, so wall-clock time is the slowest section
+    rather than the sum of all of them. Raises LLMReportError if any
+    section fails.
+    """
+    sections = await generate_reports(provider, split_prompt_sections(prompt_data))
+    return "\n\n".join(sections)
 
 
 # --- Data Gathering Functions ---
 
 
+# Weekly HTML report filenames, e.g. 2024-week3.html
+_REPORT_HTML_RE = re.compile(r"^(\d{4})-week(\d+)\.html$")
+_SIMPL_RE = re.compile(r"^(\d{4})-week(\d+)\.md$")
+
+# Placeholder text in the prompt file that is stripped before use
+_DATA_PLACEHOLDER_RE = re.compile(r"Data: \[.*?]")
+
+
+@functools.lru_cache(maxsize=8)
+def _read_system_prompt(filepath: str, mtime: float) -> str:
+    # mtime is part of the cache key so edits to the file are picked up
+    with open(filepath, "r") as f:
+        prompt = f.read()
+    # Remove the placeholder text
+    return _DATA_PLACEHOLDER_RE.sub("", prompt).strip()
+
+
 def get_system_prompt(filepath: str) -> str:
     """Reads the system prompt and removes the placeholder."""
     try:
-        with open(filepath, "r") as f:
-            prompt = f.read()
-        # Remove the placeholder text
-        prompt = re.sub(r"Data: \[.*?]", "", prompt).strip()
-        return prompt
+        return _read_system_prompt(filepath, os.stat(filepath).st_mtime)
     except FileNotFoundError:
         return "You are a helpful fantasy football assistant."  # Fallback
 
 
-def get_historical_data(year: int, week: int) -> str:
+def _read_text(filepath: str) -> str:
+    return Path(filepath).read_text(encoding="utf-8")
+
+
+def _read_texts(filepaths: list[str]) -> list[str]:
+    """Reads many small files in parallel, returning contents in order."""
+    if not filepaths:
+        return []
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        return list(executor.map(_read_text, filepaths))
+
+
+LEAGUE_DATA_CACHE_DIR = "reports/.cache"
+
+
+@functools.lru_cache(maxsize=1)
+def _espn_api_version() -> str:
+    try:
+        return importlib.metadata.version("espn_api")
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _load_league_data(year: int) -> LeagueData:
+    """
+    Initialize LeagueData for a year, logging how long it took.
+
+    Past seasons never change, so their LeagueData is pickled to disk and
+    reused across runs instead of being re-fetched from ESPN.
+    """
+    # Pickles of another espn_api version may not match its classes, so the
+    # version is part of the name and an upgrade refetches
+    cache_path = os.path.join(
+        LEAGUE_DATA_CACHE_DIR, f"league_{year}-espn_api-{_espn_api_version()}.pkl"
+    )
+    cacheable = year < LEAGUE_YEAR
+
+    if cacheable and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                league_data = pickle.load(f)
+            logging.info(f"Loaded LeagueData for {year} from {cache_path}")
+            return league_data
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable cache {cache_path}: {e}")
+
+    logging.info(f"Initializing LeagueData for year {year}...")
+    start_time = time.time()
+    league_data = LeagueData(year=year)
+    end_time = time.time()
+    logging.info(
+        f"LeagueData for {year} initialized in {end_time - start_time:.2f} seconds."
+    )
+
+    if cacheable:
+        try:
+            os.makedirs(LEAGUE_DATA_CACHE_DIR, exist_ok=True)
+            with open(cache_path, "wb") as f:
+                pickle.dump(league_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logging.warning(f"Could not cache LeagueData for {year}: {e}")
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+
+    return league_data
+
+
+def _write_text(filepath: str, content: str):
+    with open(filepath, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+async def _write_simplified_summary(
+    pool: ThreadPoolExecutor,
+    week: int,
+    year: int,
+    league_data: LeagueData,
+    filepath: str,
+) -> str:
+    """Generate a simplified summary on pool and cache it to filepath."""
+    loop = asyncio.get_running_loop()
+    content = await loop.run_in_executor(
+        pool, generate_simplified_summary, week, year, league_data
+    )
+    # Write off the pool so the disk I/O overlaps other weeks' generation
+    await asyncio.to_thread(_write_text, filepath, content)
+    return content
+
+
+async def get_historical_data_async(year: int, week: int) -> str:
     """
     Gathers historical data from simplified markdown files, generating and caching them if needed.
 
     This function now uses simplified summaries to reduce token count.
-    It reuses LeagueData objects per year to optimize API calls.
+    Cached summaries are read concurrently; for the rest, one LeagueData object
+    is built per year (all years in parallel) and the missing summaries are
+    then generated in parallel.
     """
-    historical_content = []
     simplified_reports_dir = "reports/simplified"
     os.makedirs(simplified_reports_dir, exist_ok=True)
 
-    # Cache LeagueData objects per year
-    league_data_cache = {}
-
-    all_report_html_files = glob.glob("reports/*-week*.html")
-
-    # Extract all unique years and weeks from the HTML filenames
-    all_historical_weeks = set()
-    for html_file in all_report_html_files:
-        basename = os.path.basename(html_file)
-        match = re.search(r"(\d{4})-week(\d+)\.html", basename)
-        if match:
-            file_year, file_week = int(match.group(1)), int(match.group(2))
-            all_historical_weeks.add((file_year, file_week))
-
-    # Sort historical weeks
-    sorted_historical_weeks = sorted(list(all_historical_weeks))
-
-    for file_year, file_week in sorted_historical_weeks:
-        # Only include files from previous years, or previous weeks of the current year
-        if file_year < year or (file_year == year and file_week < week):
-            simplified_filename = f"{file_year}-week{file_week}.md"
-            simplified_filepath = os.path.join(
-                simplified_reports_dir, simplified_filename
-            )
+    # Weeks that already have a simplified summary are the primary index
+    simplified_weeks = set()
+    with os.scandir(simplified_reports_dir) as entries:
+        for entry in entries:
+            match = _SIMPL_RE.match(entry.name)
+            if match:
+                simplified_weeks.add((int(match[1]), int(match[2])))
 
-            if os.path.exists(simplified_filepath):
-                with open(simplified_filepath, "r", encoding="utf-8") as f:
-                    content = f.read()
-            else:
-                # Get LeagueData object for the current year from cache or create new
-                if file_year not in league_data_cache:
-                    logging.info(f"Initializing LeagueData for year {file_year}...")
-                    start_time = time.time()
-                    league_data_cache[file_year] = LeagueData(year=file_year)
-                    end_time = time.time()
-                    logging.info(
-                        f"LeagueData for {file_year} initialized in {end_time - start_time:.2f} seconds."
+    # HTML reports only add weeks whose summary still needs generating
+    all_historical_weeks = set(simplified_weeks)
+    if os.path.isdir("reports"):
+        with os.scandir("reports") as entries:
+            for entry in entries:
+                match = _REPORT_HTML_RE.match(entry.name)
+                if match:
+                    all_historical_weeks.add((int(match[1]), int(match[2])))
+
+    # Only include previous years, or previous weeks of the current year
+    historical_weeks = [
+        (file_year, file_week)
+        for file_year, file_week in sorted(all_historical_weeks)
+        if file_year < year or (file_year == year and file_week < week)
+    ]
+    if not historical_weeks:
+        return "No historical data found."
+
+    def simplified_filepath(file_year, file_week):
+        return os.path.join(simplified_reports_dir, f"{file_year}-week{file_week}.md")
+
+    cached, missing = [], []
+    for w in historical_weeks:
+        (cached if w in simplified_weeks else missing).append(w)
+
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor() as pool:
+        # Read the cached summaries while any missing years are initialized
+        missing_years = sorted({file_year for file_year, _ in missing})
+        cached_contents, *league_datas = await asyncio.gather(
+            asyncio.to_thread(_read_texts, [simplified_filepath(*w) for w in cached]),
+            *(
+                loop.run_in_executor(pool, _load_league_data, file_year)
+                for file_year in missing_years
+            ),
+        )
+        contents = dict(zip(cached, cached_contents))
+
+        if missing:
+            league_data_cache = dict(zip(missing_years, league_datas))
+
+            generated = await asyncio.gather(
+                *(
+                    _write_simplified_summary(
+                        pool,
+                        file_week,
+                        file_year,
+                        league_data_cache[file_year],
+                        simplified_filepath(file_year, file_week),
                     )
-                current_year_league_data = league_data_cache[file_year]
+                    for file_year, file_week in missing
+                )
+            )
+            contents.update(zip(missing, generated))
 
-                # Generate simplified summary and cache it
-                content = generate_simplified_summary(
-                    file_week, file_year, current_year_league_data
-                )  # Pass file_year
-                with open(simplified_filepath, "w", encoding="utf-8") as f:
-                    f.write(content)
+    buf = io.StringIO()
+    for i, (file_year, file_week) in enumerate(historical_weeks):
+        if i:
+            buf.write("\n\n")
+        simplified_filename = f"{file_year}-week{file_week}.md"
+        buf.write(f"""---\nData from {simplified_filename} ---\n\n""")
+        buf.write(contents[(file_year, file_week)])
 
-            header = f"""---\nData from {simplified_filename} ---\n\n"""
-            historical_content.append(header + content)
+    return buf.getvalue()
 
-    return (
-        "\n\n".join(historical_content)
-        if historical_content
-        else "No historical data found."
+
+def get_historical_data(year: int, week: int) -> str:
+    """Synchronous wrapper around get_historical_data_async."""
+    return asyncio.run(get_historical_data_async(year, week))
+
+
+LLM_CACHE_DIR = "reports/.llmcache"
+
+# Historical data longer than this (~4k tokens) is condensed before use
+HISTORY_COMPRESS_CHARS = 16_000
+
+_COMPRESS_HISTORY_PROMPT = (
+    "You are a fantasy football analyst. Distill the historical league data "
+    "you are given into a season narrative of at most 500 tokens. Keep team "
+    "records, streaks, rivalries, standout performances and notable trends; "
+    "drop week-by-week box score detail."
+)
+
+
+def compress_history(historical: str, provider: LLMProvider) -> str:
+    """
+    Condenses long historical data with the provider's cheap model.
+
+    The primary model's latency and cost grow with prompt size, and the raw
+    history grows every week, so late in the season it is summarized first.
+    Results are cached by content hash; on failure the raw data is returned.
+    """
+    if len(historical) <= HISTORY_COMPRESS_CHARS:
+        return historical
+
+    cheap_model = getattr(provider, "cheap_model", None)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{cheap_model}\0{historical}".encode("utf-8"))
+    cache_path = os.path.join(LLM_CACHE_DIR, f"history-{h.hexdigest()}.md")
+    try:
+        return _read_text(cache_path)
+    except FileNotFoundError:
+        pass
+
+    logging.info(
+        f"Compressing {len(historical)} chars of historical data with {cheap_model}..."
     )
+    try:
+        compressed = provider.generate_report(
+            {
+                "system": _COMPRESS_HISTORY_PROMPT,
+                "current": "None; summarize the historical data only.",
+                "historical": historical,
+            },
+            model=cheap_model,
+        )
+    except LLMReportError as e:
+        logging.warning(f"History compression failed; using the raw data. {e}")
+        return historical
+    if not compressed:
+        logging.warning("History compression returned nothing; using the raw data.")
+        return historical
 
+    os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+    _write_text(cache_path, compressed)
+    return compressed
 
-def create_llm_report(week: int, year: int, provider: LLMProvider) -> str:
-    """Generates a report from an LLM using game data."""
-    # 1. Gather data
-    system_prompt = get_system_prompt("prompt.txt")
-    current_data = generate_summary(week)
-    historical_data = get_historical_data(year, week)
-
-    prompt_data = {
-        "system": system_prompt,
-        "current": current_data,
-        "historical": historical_data,
+
+def build_prompt_data(
+    week: int, year: int, provider: LLMProvider | None = None
+) -> dict:
+    """
+    Gathers the system prompt, current week and historical data for a report.
+
+    When a provider is given, long historical data is compressed with its
+    cheap model (see compress_history).
+    """
+    historical = get_historical_data(year, week)
+    if provider is not None:
+        historical = compress_history(historical, provider)
+    return {
+        "system": get_system_prompt("prompt.txt"),
+        "current": generate_summary(week),
+        "historical": historical,
     }
 
+
+def _response_cache_path(prompt_data: dict, provider: LLMProvider) -> str:
+    """Content-addressed cache path for a provider's response to prompt_data."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in (
+        type(provider).__name__,
+        getattr(provider, "model", ""),
+        prompt_data.get("system", ""),
+        prompt_data.get("current", ""),
+        prompt_data.get("historical", ""),
+    ):
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return os.path.join(LLM_CACHE_DIR, f"{h.hexdigest()}.md")
+
+
+def get_cached_response(prompt_data: dict, provider: LLMProvider) -> str | None:
+    """Returns a previously generated report for identical prompt data, if any."""
+    try:
+        return _read_text(_response_cache_path(prompt_data, provider))
+    except FileNotFoundError:
+        return None
+
+
+def cache_response(prompt_data: dict, provider: LLMProvider, report: str):
+    """
+    Stores a generated report so identical reruns skip the API call.
+
+    Only call this with complete reports; failures raise LLMReportError
+    and must never reach the cache.
+    """
+    if not report:
+        return
+    os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+    _write_text(_response_cache_path(prompt_data, provider), report)
+
+
+def create_llm_report(
+    week: int,
+    year: int,
+    provider: LLMProvider,
+    use_cache: bool = True,
+    sink=None,
+) -> str:
+    """
+    Generates a report from an LLM using game data.
+
+    If `sink` is given, the report is also written to it as it is generated
+    (streamed where the provider and prompt allow). Returns the full report,
+    or the error text if generation failed; failed reports are not cached.
+    """
+    # 1. Gather data
+    prompt_data = build_prompt_data(week, year, provider)
+
+    if use_cache:
+        report = get_cached_response(prompt_data, provider)
+        if report is not None:
+            logging.info("Using cached LLM response.")
+            if sink is not None:
+                sink.write(report)
+            return report
+
     # 2. Generate report from the provider
-    report = provider.generate_report(prompt_data)
+    try:
+        if len(split_prompt_sections(prompt_data)) > 1:
+            # Sections are generated in parallel, then written in order
+            report = asyncio.run(generate_sectioned_report(provider, prompt_data))
+            if sink is not None:
+                sink.write(report)
+        elif sink is not None:
+            report = provider.stream_report(prompt_data, sink)
+        else:
+            report = provider.generate_report(prompt_data)
+    except LLMReportError as e:
+        # Any partial text has already been streamed; finish with the error
+        if sink is not None:
+            sink.write(str(e))
+        return str(e)
+
+    cache_response(prompt_data, provider, report)
     return report
 
 
-def main(week: int, year: int, llm_provider_name: str, force: bool, preview: bool):
+def batch_generate_reports(
+    week_year_pairs: list[tuple[int, int]],
+    provider: LLMProvider,
+    use_cache: bool = True,
+) -> dict[tuple[int, int], str]:
+    """
+    Generates reports for many weeks in a single provider batch job.
+
+    Batch jobs are billed at a discount and are not subject to interactive
+    rate limits, which suits backfilling a season of reports. Weeks with a
+    cached response are not resubmitted.
+    """
+    prompts = {
+        f"{year}-w{week}": build_prompt_data(week, year, provider)
+        for week, year in week_year_pairs
+    }
+
+    results = {}
+    if use_cache:
+        for key, prompt_data in prompts.items():
+            report = get_cached_response(prompt_data, provider)
+            if report is not None:
+                results[key] = report
+
+    pending = {key: p for key, p in prompts.items() if key not in results}
+    if pending:
+        for key, report in provider.generate_batch(pending).items():
+            if isinstance(report, LLMReportError):
+                results[key] = str(report)
+            else:
+                cache_response(pending[key], provider, report)
+                results[key] = report
+
+    return {
+        (week, year): results[f"{year}-w{week}"] for week, year in week_year_pairs
+    }
+
+
+class _TeeWriter:
+    """Writes text to several streams at once."""
+
+    def __init__(self, *streams):
+        self.streams = streams
+
+    def write(self, text: str):
+        for stream in self.streams:
+            stream.write(text)
+            stream.flush()
+
+
+def get_report_path(week: int, year: int) -> str:
+    """Path of the saved LLM report for a week."""
+    # ./reports/llm_summary/YYYY-week(X)_llm_summary.md
+    summary_dir = "reports/llm_summary"
+    os.makedirs(summary_dir, exist_ok=True)
+    return os.path.join(summary_dir, f"{year}-week{week}_llm_summary.md")
+
+
+def _backup_report(report_path: str):
+    """Moves an existing report aside to report_path.bk before it is rewritten."""
+    if os.path.exists(report_path):
+        backup_path = f"{report_path}.bk"
+        # Same directory, so this is a single atomic rename
+        os.replace(report_path, backup_path)
+        logging.info(f"Backed up existing report to {backup_path}")
+
+
+class _ReportFileWriter:
+    """
+    Writes a report file, opened on the first write.
+
+    Deferring the open (and backup of any existing report) means a failure
+    while gathering data leaves the previous report untouched.
+    """
+
+    def __init__(self, report_path: str):
+        self.report_path = report_path
+        self._file = None
+
+    def write(self, text: str):
+        if self._file is None:
+            _backup_report(self.report_path)
+            self._file = open(self.report_path, "w", encoding="utf-8")
+        self._file.write(text)
+
+    def flush(self):
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+
+def main(
+    week: int,
+    year: int,
+    llm_provider_name: str,
+    force: bool,
+    preview: bool,
+    batch: bool = False,
+    start_week: int | None = None,
+):
     load_dotenv()
 
+    if batch and start_week is not None and not 1 <= start_week <= week:
+        print(f"Error: --start-week must be between 1 and --week ({week}).")
+        return
+
     provider_instance = None
     if llm_provider_name == "openai":
         api_key = os.getenv("OPENAI_API_KEY")
@@ -228,29 +970,70 @@ def main(week: int, year: int, llm_provider_name: str, force: bool, preview: boo
         )
         return
 
-    print(
-        f"Gathering data for week {week}, {year} and generating LLM report using {llm_provider_name}...\n"
-    )
+    if not provider_instance.validate():
+        print(
+            f"Error: could not authenticate with {llm_provider_name}. Check your API key."
+        )
+        return
 
-    llm_report = create_llm_report(week, year, provider_instance)
+    if batch:
+        weeks = range(start_week or week, week + 1)
+        if not preview and not force:
+            existing = [
+                path
+                for path in (get_report_path(w, year) for w in weeks)
+                if os.path.exists(path)
+            ]
+            if existing:
+                print(
+                    f"Error: {', '.join(existing)} already exist(s). Use --force to overwrite."
+                )
+                return
+        print(
+            f"Gathering data for weeks {weeks.start}-{week}, {year} and submitting a {llm_provider_name} batch job...\n"
+        )
+        reports = batch_generate_reports(
+            [(w, year) for w in weeks], provider_instance, use_cache=not force
+        )
+        for (report_week, report_year), llm_report in reports.items():
+            if preview:
+                print(f"\n--- Week {report_week}, {report_year} ---\n")
+                print(llm_report)
+                continue
+            report_path = get_report_path(report_week, report_year)
+            _backup_report(report_path)
+            with open(report_path, "w", encoding="utf-8") as f:
+                f.write(llm_report)
+            logging.info(f"LLM report saved to {report_path}")
+        return
+
+    report_path = get_report_path(week, year)
+    if not preview and not force and os.path.exists(report_path):
+        print(f"Error: {report_path} already exists. Use --force to overwrite.")
+        return
 
     print(
-        "\n--- Generated LLM Report ---\
-"
+        f"Gathering data for week {week}, {year} and generating LLM report using {llm_provider_name}...\n"
     )
-    print(llm_report)
 
-    # Save the report to file
-    # timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S") # Removed timestamp
-    report_filename_base = f"{year}-week{week}_llm_summary"
+    print("\n--- Generated LLM Report ---\n")
 
-    # ./reports/llm_summary/YYYY-week(X)_llm_summary.md
-    summary_dir = "reports/llm_summary"
-    os.makedirs(summary_dir, exist_ok=True)
-    report_path = os.path.join(summary_dir, f"{report_filename_base}.md")
-    with open(report_path, "w", encoding="utf-8") as f:
-        f.write(llm_report)
-    logging.info(f"LLM report saved to {report_path}")
+    # Stream the report to the console and its file as it is generated;
+    # --preview only prints it
+    with contextlib.ExitStack() as stack:
+        if preview:
+            sink = _TeeWriter(sys.stdout)
+        else:
+            report_file = stack.enter_context(
+                contextlib.closing(_ReportFileWriter(report_path))
+            )
+            sink = _TeeWriter(sys.stdout, report_file)
+        create_llm_report(
+            week, year, provider_instance, use_cache=not force, sink=sink
+        )
+    print()
+    if not preview:
+        logging.info(f"LLM report saved to {report_path}")
 
 
 # Example of how to run this script.
@@ -263,5 +1046,7 @@ if __name__ == "__main__":
     parser.add_argument("--llm-provider", type=str, default="openai", choices=["openai", "gemini"], help="The LLM provider to use.")
     parser.add_argument("--force", action="store_true", help="Force overwrite of existing report by creating a backup.")
     parser.add_argument("--preview", action="store_true", help="Print the report to the console without saving to a file.")
+    parser.add_argument("--batch", action="store_true", help="Generate reports for --start-week through --week in one discounted provider batch job.")
+    parser.add_argument("--start-week", type=int, default=None, help="First week to include with --batch (default: --week).")
     args = parser.parse_args()
-    main(week=args.week, year=args.year, llm_provider_name=args.llm_provider, force=args.force, preview=args.preview)
+    main(week=args.week, year=args.year, llm_provider_name=args.llm_provider, force=args.force, preview=args.preview, batch=args.batch, start_week=args.start_week)
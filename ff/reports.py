@@ -1,20 +1,29 @@
 """Generate fantasy football reports"""
 
-from asyncio import sleep
 import os
 import hashlib
+import functools
+import itertools
+import operator
+import sqlite3
+import time
+import urllib.error
 import urllib.request
+import posixpath
 import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import timedelta, datetime
 from pathlib import Path
+from urllib.parse import urlsplit
 import json
 from .data import LeagueData
 from .stat_category_map import STAT_CATEGORY_LOOKUP
 from espn_api.football.constant import SETTINGS_SCORING_FORMAT_MAP, PLAYER_STATS_MAP
 from .stats import (
-    calculate_weekly_scores,
+    calculate_week,
     calculate_matchups,
-    points_per_player_per_position,
     calculate_top_players,
 )
 from .templates import TemplateEngine
@@ -24,37 +33,144 @@ from .features.high_roller import HighRollerFeature
 from .features.attendance import AttendanceFeature
 from .utils.geocoding_utils import Geocoder
 
-
-def cache_logo(logo_url):
-    """Downloads and caches a logo if not already present.
+# Logos cached before the switch to BLAKE2b names (see _hash_url) use MD5-based
+# names. Keep those files: previously generated reports/*.html still reference
+# them, and build.sh publishes cache/images alongside those reports.
+LOGO_CACHE_DIR = "cache/images"
+# In-progress logo downloads. A sibling of LOGO_CACHE_DIR (same filesystem,
+# so finished files can be renamed in) that build.sh does not publish.
+LOGO_DOWNLOAD_DIR = "cache/images.part"
+REPORTS_DIR = "reports"
+
+# These directories are fixed, so create them once rather than on every call
+os.makedirs(LOGO_CACHE_DIR, exist_ok=True)
+os.makedirs(LOGO_DOWNLOAD_DIR, exist_ok=True)
+os.makedirs(REPORTS_DIR, exist_ok=True)
+
+ZODIAC_NAMES = {
+    "♈": "Aries",
+    "♉": "Taurus",
+    "♊": "Gemini",
+    "♋": "Cancer",
+    "♌": "Leo",
+    "♍": "Virgo",
+    "♎": "Libra",
+    "♏": "Scorpio",
+    "♐": "Sagittarius",
+    "♑": "Capricorn",
+    "♒": "Aquarius",
+    "♓": "Pisces",
+}
+
+# Reverse lookup of ESPN stat name to stat id
+_STAT_NAME_TO_ID = {v: int(k) for k, v in PLAYER_STATS_MAP.items()}
+
+# Display order for starters in the player breakdown section
+_POS_RANK = {
+    pos: rank
+    for rank, pos in enumerate(["QB", "RB", "WR", "TE", "FLEX", "D/ST", "K", "P"])
+}
+
+
+def _player_sort_key(player):
+    """Sort key placing starters in position order, followed by bench players"""
+    slot = player["slot_position"]
+    if slot == "BE" or slot == "IR":
+        return (1, 0)  # Bench players last
+    # Other starters after defined order
+    return (0, _POS_RANK.get(slot, len(_POS_RANK)))
+
+
+def _margin(matchup):
+    """Absolute point difference between the two teams in a matchup"""
+    return abs(matchup["home_team"]["score"] - matchup["away_team"]["score"])
+
+
+def _largest_margin(matchups, team_abbrev_to_name):
+    """Summarize the matchup with the largest margin of victory
 
     Args:
-        logo_url: The URL of the logo to download.
+        matchups: Iterable of matchup dictionaries
+        team_abbrev_to_name: Mapping of team abbreviation to team name
 
     Returns:
-        The local filename of the cached logo.
+        Dictionary describing the largest margin, or None if there are no matchups
     """
-    if not logo_url:
+    top = max(matchups, key=_margin, default=None)
+    if top is None:
         return None
 
+    if top["winner"] == "home":
+        winner, loser = top["home_team"], top["away_team"]
+    else:
+        winner, loser = top["away_team"], top["home_team"]
+
+    return {
+        "winner_name": team_abbrev_to_name.get(winner["abbrev"]),
+        "winner_score": winner["score"],
+        "loser_score": loser["score"],
+        "margin": _margin(top),
+    }
+
+
+@functools.lru_cache(maxsize=512)
+def _hash_url(url):
+    """Filename-safe hash of a logo URL, memoized to skip repeat encode/hash work"""
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Validators (ETag / Last-Modified) for downloaded logos. Kept outside
+# cache/images since that directory is copied verbatim into the site build.
+LOGO_INDEX_PATH = "cache/logo_index.sqlite"
+
+
+def _logo_index():
+    """Open the logo metadata index, creating it if needed"""
+    conn = sqlite3.connect(LOGO_INDEX_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS logos ("
+        "filename TEXT PRIMARY KEY, url TEXT, etag TEXT, "
+        "last_modified TEXT, fetched_at REAL)"
+    )
+    return conn
+
+
+def _get_logo_validators(filename):
+    """Return the stored (etag, last_modified) for a cached logo"""
+    with closing(_logo_index()) as conn:
+        row = conn.execute(
+            "SELECT etag, last_modified FROM logos WHERE filename = ?", (filename,)
+        ).fetchone()
+    return row if row else (None, None)
+
+
+def _set_logo_validators(filename, url, etag, last_modified):
+    """Record the validators returned with a logo download"""
+    with closing(_logo_index()) as conn, conn:
+        conn.execute(
+            "INSERT OR REPLACE INTO logos VALUES (?, ?, ?, ?, ?)",
+            (filename, url, etag, last_modified, time.time()),
+        )
+
+
+def _logo_local_path(logo_url):
+    """Resolve where a logo is cached and which URL to fetch it from
+
+    Args:
+        logo_url: The logo URL, or a local path for bundled images
+
+    Returns:
+        Tuple of (filename, local_path, url_to_download)
+    """
     if not logo_url.startswith("http"):
         filename = os.path.basename(logo_url)
-        cache_dir = "cache/images"
-        os.makedirs(cache_dir, exist_ok=True)
-        local_path = os.path.join(cache_dir, filename)
-        if not os.path.exists(local_path):
-            shutil.copy(logo_url, local_path)
-        return filename
-
-    # Store the original URL for hashing
-    original_logo_url = logo_url
+        return filename, os.path.join(LOGO_CACHE_DIR, filename), logo_url
 
     # Handle specific URL redirects
     if (
         "https://practicalhorsemanmag.com/.image/t_share/MTQ0ODEwNTE0ODI5MDI2Njc4/ph-acorns-horses.png"
         in logo_url
     ):
-        # print("[WARN] Downloading replacement logo")
         # This is the URL we *want* to download if the original matches the pattern
         logo_url_to_download = f"https://practicalhorsemanmag.com/wp-content/uploads/migrations/practicalhorseman/PH-acorns-horses.png"
     else:
@@ -62,24 +178,72 @@ def cache_logo(logo_url):
         logo_url_to_download = logo_url
 
     # Calculate hash based on the ORIGINAL URL, so all requests for the original URL map to the same cache file
-    url_hash = hashlib.md5(original_logo_url.encode("utf-8")).hexdigest()
-    file_extension = os.path.splitext(logo_url_to_download)[
-        1
-    ]  # Use extension from the URL we intend to download
-    if "_dark" in file_extension:
-        file_extension = file_extension.replace("_dark", "")
-    if "?" in file_extension:
-        file_extension = file_extension.split("?")[0]
-    if not file_extension:
-        file_extension = ".png"
+    url_hash = _hash_url(logo_url)
+    # Use extension from the path of the URL we intend to download
+    file_extension = (
+        posixpath.splitext(urlsplit(logo_url_to_download).path)[1].replace(
+            "_dark", ""
+        )
+        or ".png"
+    )
 
     filename = f"{url_hash}{file_extension}"
-    cache_dir = "cache/images"
-    os.makedirs(cache_dir, exist_ok=True)
-    local_path = os.path.join(cache_dir, filename)
+    return filename, os.path.join(LOGO_CACHE_DIR, filename), logo_url_to_download
+
 
-    # Download if it doesn't exist
-    if not os.path.exists(local_path):
+def cache_logos(logo_urls, refresh=False, max_workers=5):
+    """Cache a batch of logos, downloading them concurrently.
+
+    Downloads are network bound, so fetching the unique URLs in parallel
+    brings the total wait close to the slowest single request.
+
+    Args:
+        logo_urls: Iterable of logo URLs (duplicates and empty values are fine)
+        refresh: Revalidate already cached logos, see cache_logo
+        max_workers: Maximum number of concurrent downloads
+
+    Returns:
+        Dictionary mapping each unique URL to its cached filename
+    """
+    unique_urls = {url for url in logo_urls if url}
+    if not unique_urls:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        filenames = executor.map(
+            functools.partial(cache_logo, refresh=refresh), unique_urls
+        )
+        return dict(zip(unique_urls, filenames))
+
+
+@functools.lru_cache(maxsize=512)
+def cache_logo(logo_url, refresh=False):
+    """Downloads and caches a logo if not already present.
+
+    Results are memoized per process, since a URL always maps to the same
+    cached filename and the same team logos recur throughout a report.
+
+    Args:
+        logo_url: The URL of the logo to download.
+        refresh: Revalidate an already cached logo with a conditional GET,
+            re-downloading it only if the server reports it has changed.
+
+    Returns:
+        The local filename of the cached logo.
+    """
+    if not logo_url:
+        return None
+
+    filename, local_path, logo_url_to_download = _logo_local_path(logo_url)
+
+    if not logo_url.startswith("http"):
+        if not os.path.exists(local_path):
+            shutil.copy(logo_url, local_path)
+        return filename
+
+    # Download if it doesn't exist (or revalidate it when refreshing)
+    is_cached = os.path.exists(local_path)
+    if not is_cached or refresh:
         try:
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
@@ -87,15 +251,39 @@ def cache_logo(logo_url):
                 "Accept": "*/*",
                 "Cookie": f"swid={SWID}; espn_s2={ESPN_S2};",
             }
+            if is_cached:
+                etag, last_modified = _get_logo_validators(filename)
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
             req = urllib.request.Request(
                 logo_url_to_download, headers=headers
             )  # Use the URL we decided to download
-            with (
-                urllib.request.urlopen(req) as response,
-                open(local_path, "wb") as out_file,
-            ):
-                shutil.copyfileobj(response, out_file)
+            with urllib.request.urlopen(req) as response:
+                # Download to a temp file and swap it in only once complete,
+                # so a failed transfer never leaves a truncated logo
+                fd, tmp_path = tempfile.mkstemp(dir=LOGO_DOWNLOAD_DIR)
+                try:
+                    with os.fdopen(fd, "wb") as out_file:
+                        # mkstemp creates owner-only files; logos are published
+                        os.fchmod(out_file.fileno(), 0o644)
+                        # Large enough that most logos copy in a single read/write
+                        shutil.copyfileobj(response, out_file, length=1024 * 1024)
+                    os.replace(tmp_path, local_path)
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
         except Exception as e:
+            if isinstance(e, urllib.error.HTTPError) and e.code == 304:
+                # Not modified, the cached copy is still current
+                return filename
+            if is_cached:
+                # Keep serving the copy we already have
+                print(f"Error refreshing logo: {logo_url_to_download} - {e}")
+                return filename
             print(
                 f"Error downloading logo: {logo_url_to_download} - {e}"
             )  # Print the URL that failed
@@ -117,31 +305,44 @@ def cache_logo(logo_url):
                 print(f"Error copying default logo to cache: {copy_e}. Returning None.")
                 return None
 
+        # The logo is already in place; failing to record its validators
+        # only means the next refresh downloads it unconditionally
+        try:
+            _set_logo_validators(
+                filename, logo_url_to_download, etag, last_modified
+            )
+        except sqlite3.Error as e:
+            print(f"Error recording logo validators: {filename} - {e}")
+
     return filename
 
 
 class WeeklyReport:
     """Generate weekly fantasy football reports"""
 
-    def __init__(self, year=LEAGUE_YEAR):
+    def __init__(self, year=LEAGUE_YEAR, refresh_logos=False):
         """Initialize the report generator
 
         Args:
             year: The NFL season year to generate a report for
+            refresh_logos: Revalidate cached logos against their source
         """
         self.year = year
+        self.refresh_logos = refresh_logos
         self.data = LeagueData(year)
         self.template = TemplateEngine()
         self.root_dir = Path(__file__).parent.parent
 
+    def _cache_logo(self, logo_url):
+        """Cache a logo, honoring the report's refresh setting"""
+        return cache_logo(logo_url, refresh=self.refresh_logos)
+
     def get_zodiac_emoji(self, birth_date_str):
         """Get zodiac emoji based on birth date string"""
         if not birth_date_str:
             return ""
 
         try:
-            from datetime import datetime
-
             # Parse birth date (assuming it could be various formats)
             if isinstance(birth_date_str, int):
                 # Convert timestamp to date if it's an integer
@@ -191,21 +392,7 @@ class WeeklyReport:
 
     def get_zodiac_name(self, zodiac_emoji):
         """Get zodiac name from emoji"""
-        zodiac_names = {
-            "♈": "Aries",
-            "♉": "Taurus",
-            "♊": "Gemini",
-            "♋": "Cancer",
-            "♌": "Leo",
-            "♍": "Virgo",
-            "♎": "Libra",
-            "♏": "Scorpio",
-            "♐": "Sagittarius",
-            "♑": "Capricorn",
-            "♒": "Aquarius",
-            "♓": "Pisces",
-        }
-        return zodiac_names.get(zodiac_emoji, "")
+        return ZODIAC_NAMES.get(zodiac_emoji, "")
 
     def _calculate_faked_data(self, game_data_list):
         if not game_data_list:
@@ -288,106 +475,88 @@ class WeeklyReport:
         # Adjust to the Monday *after* the current week
         target_monday_date = week_monday_date + timedelta(days=7)
 
-        matchups = calculate_matchups(box_scores)
-        weekly_scores = calculate_weekly_scores(box_scores)
+        matchups, weekly_scores = calculate_week(box_scores)
 
         # Sort weekly scores by score (highest first)
-        weekly_scores.sort(key=lambda x: x["score"], reverse=True)
+        weekly_scores.sort(key=operator.itemgetter("score"), reverse=True)
 
         # --- Margin of Victory ---
         team_abbrev_to_name = {
-            team.team_abbrev: team.team_name for team in self.data.league.teams
+            abbrev: team.team_name
+            for abbrev, team in self.data.teams_by_abbrev.items()
         }
 
-        largest_weekly_margin = None
-        max_weekly_margin = -1
+        largest_weekly_margin = _largest_margin(matchups, team_abbrev_to_name)
 
-        for matchup in matchups:
-            margin = abs(matchup["home_team"]["score"] - matchup["away_team"]["score"])
-            if margin > max_weekly_margin:
-                max_weekly_margin = margin
-                if matchup["winner"] == "home":
-                    winner = matchup["home_team"]
-                    loser = matchup["away_team"]
-                else:
-                    winner = matchup["away_team"]
-                    loser = matchup["home_team"]
-
-                winner_name = team_abbrev_to_name.get(winner["abbrev"])
-
-                largest_weekly_margin = {
-                    "winner_name": winner_name,
-                    "winner_score": winner["score"],
-                    "loser_score": loser["score"],
-                    "margin": margin,
-                }
-
-        largest_season_margin = None
-        max_season_margin = -1
-
-        for w in range(1, week + 1):
-            weekly_box_scores = self.data.get_box_scores(w)
-            weekly_matchups = calculate_matchups(weekly_box_scores)
-            for matchup in weekly_matchups:
-                margin = abs(
-                    matchup["home_team"]["score"] - matchup["away_team"]["score"]
+        # The current week's matchups are already calculated above
+        season_matchups = itertools.chain(
+            itertools.chain.from_iterable(
+                calculate_matchups(weekly_box_scores)
+                for weekly_box_scores in self.data.get_box_scores_for_weeks(
+                    range(1, week)
                 )
-                if margin > max_season_margin:
-                    max_season_margin = margin
-                    if matchup["winner"] == "home":
-                        winner = matchup["home_team"]
-                        loser = matchup["away_team"]
-                    else:
-                        winner = matchup["away_team"]
-                        loser = matchup["home_team"]
-
-                    winner_name = team_abbrev_to_name.get(winner["abbrev"])
-
-                    largest_season_margin = {
-                        "winner_name": winner_name,
-                        "winner_score": winner["score"],
-                        "loser_score": loser["score"],
-                        "margin": margin,
-                    }
+            ),
+            matchups,
+        )
+        largest_season_margin = _largest_margin(season_matchups, team_abbrev_to_name)
 
         # --- Logo Caching ---
+        # Fetch every team logo in one concurrent batch, one request per unique
+        # URL. Later per-team lookups (standings, rankings, players) are then
+        # served from cache_logo's memo.
+        team_logos = cache_logos(
+            itertools.chain(
+                (team.logo_url for team in self.data.league.teams),
+                (
+                    team.get("logo")
+                    for matchup in matchups
+                    for team in (matchup["home_team"], matchup["away_team"])
+                ),
+            ),
+            refresh=self.refresh_logos,
+        )
+
         for matchup in matchups:
             if "logo" in matchup["home_team"]:
-                matchup["home_team"]["logo"] = cache_logo(matchup["home_team"]["logo"])
+                matchup["home_team"]["logo"] = team_logos.get(
+                    matchup["home_team"]["logo"]
+                )
             if "logo" in matchup["away_team"]:
-                matchup["away_team"]["logo"] = cache_logo(matchup["away_team"]["logo"])
+                matchup["away_team"]["logo"] = team_logos.get(
+                    matchup["away_team"]["logo"]
+                )
 
         for score in weekly_scores:
             if "logo" in score:
-                score["logo"] = cache_logo(score["logo"])
+                score["logo"] = team_logos.get(score["logo"])
 
         standings = self.data.get_standings()
         for team in standings:
-            team.logo = cache_logo(team.logo_url)
+            team.logo = self._cache_logo(team.logo_url)
 
         power_rankings = self.data.get_power_rankings(week)
         for rank in power_rankings:
-            rank[1].logo = cache_logo(rank[1].logo_url)
+            rank[1].logo = self._cache_logo(rank[1].logo_url)
 
         top_week = self.data.get_top_scored_week()
         if top_week and top_week[0]:
-            top_week[0].logo = cache_logo(top_week[0].logo_url)
+            top_week[0].logo = self._cache_logo(top_week[0].logo_url)
 
         low_week = self.data.get_least_scored_week()
         if low_week and low_week[0]:
-            low_week[0].logo = cache_logo(low_week[0].logo_url)
+            low_week[0].logo = self._cache_logo(low_week[0].logo_url)
 
         top_scorer = self.data.get_top_scorer()
         if top_scorer:
-            top_scorer.logo = cache_logo(top_scorer.logo_url)
+            top_scorer.logo = self._cache_logo(top_scorer.logo_url)
 
         low_scorer = self.data.get_least_scorer()
         if low_scorer:
-            low_scorer.logo = cache_logo(low_scorer.logo_url)
+            low_scorer.logo = self._cache_logo(low_scorer.logo_url)
 
         most_pa = self.data.get_most_points_against()
         if most_pa:
-            most_pa.logo = cache_logo(most_pa.logo_url)
+            most_pa.logo = self._cache_logo(most_pa.logo_url)
 
         # Initialize features
         feature_cache_dir = Path("cache/features")
@@ -401,12 +570,15 @@ class WeeklyReport:
         # Process attendance_feature.feature_data to make it easily searchable
         # This will store game details (date, attendance, city, state, country, latlng) per pro_team
         pro_team_game_data = {}
+        game_locations = geocoder.geocode_many(
+            f"{game['city']}, {game['state']}, {game['country']}"
+            for game in attendance_feature.feature_data
+        )
         for game in attendance_feature.feature_data:
             game_location_address = (
                 f"{game['city']}, {game['state']}, {game['country']}"
             )
-            print(f"Geocoding address: {game_location_address}")
-            location = geocoder.geocode(game_location_address)
+            location = game_locations[game_location_address]
             game_latlng = None
             if location:
                 game_latlng = (location.latitude, location.longitude)
@@ -431,9 +603,9 @@ class WeeklyReport:
 
         all_players = self.data.get_weekly_players(week)
         for player in all_players:
-            player["team_logo"] = cache_logo(player["team_logo"])
+            player["team_logo"] = self._cache_logo(player["team_logo"])
             if player["pro_team"] and player["pro_team"] != "None":
-                player["pro_team_logo"] = cache_logo(
+                player["pro_team_logo"] = self._cache_logo(
                     f"images/logo_svg/{player['pro_team']}.svg"
                 )
             else:
@@ -541,22 +713,10 @@ class WeeklyReport:
 
         # --- New Points Per Player Per Position ---
 
-        # Helper for sorting players
-        pos_order = ["QB", "RB", "WR", "TE", "FLEX", "D/ST", "K", "P"]
-
-        def get_player_sort_key(player):
-            slot = player["slot_position"]
-            if slot == "BE" or slot == "IR":
-                return (1, 0)  # Bench players last
-            try:
-                return (0, pos_order.index(slot))
-            except ValueError:
-                return (0, len(pos_order))  # Other starters after defined order
-
         # Group players by team
         players_by_team = {}
-        # Create a mapping from team_name to the actual Team object for easy lookup
-        team_name_to_object = {team.team_name: team for team in self.data.league.teams}
+        # Mapping from team_name to the actual Team object for easy lookup
+        team_name_to_object = self.data.teams_by_name
 
         for player in all_players:
             team_name = player["team_name"]
@@ -578,21 +738,27 @@ class WeeklyReport:
             del players_by_team["Free Agent"]
 
         # Process stats for each player and sort
-        stat_name_to_id_map = {v: int(k) for k, v in PLAYER_STATS_MAP.items()}
         for team_name, team_data in players_by_team.items():
             for player in team_data["players"]:
                 # Normalize stats table
-                actual_breakdown = player.get("points_breakdown") or {}
-                proj_breakdown = player.get("projected_points_breakdown") or {}
+                actual_breakdown = player.get("points_breakdown")
+                proj_breakdown = player.get("projected_points_breakdown")
+                if not actual_breakdown and not proj_breakdown:
+                    player["stats_table"] = {
+                        "headers": [],
+                        "actual": [],
+                        "projected": [],
+                    }
+                    continue
+                actual_breakdown = actual_breakdown or {}
+                proj_breakdown = proj_breakdown or {}
 
-                all_stat_names = set(actual_breakdown.keys()) | set(
-                    proj_breakdown.keys()
-                )
+                all_stat_names = actual_breakdown.keys() | proj_breakdown.keys()
 
                 stat_ids = [
-                    stat_name_to_id_map.get(name)
+                    stat_id
                     for name in all_stat_names
-                    if stat_name_to_id_map.get(name) is not None
+                    if (stat_id := _STAT_NAME_TO_ID.get(name)) is not None
                 ]
 
                 # Create a list of stat info objects to sort by abbr
@@ -646,7 +812,7 @@ class WeeklyReport:
                     "projected": proj_row,
                 }
 
-            team_data["players"].sort(key=get_player_sort_key)
+            team_data["players"].sort(key=_player_sort_key)
 
         # Calculate team-specific points breakdowns
         for team_name, team_data in players_by_team.items():
@@ -663,7 +829,7 @@ class WeeklyReport:
                         if isinstance(stat_name, str) and isinstance(
                             points, (int, float)
                         ):
-                            stat_id = stat_name_to_id_map.get(stat_name)
+                            stat_id = _STAT_NAME_TO_ID.get(stat_name)
                             if stat_id:
                                 team_aggregated_points_by_id[stat_id] = (
                                     team_aggregated_points_by_id.get(stat_id, 0.0)
@@ -780,20 +946,31 @@ class WeeklyReport:
         for team_name, team_data in players_by_team.items():
             all_stat_categories.update(team_data["grouped_points_breakdown"].keys())
 
-        sorted_stat_categories = sorted(list(all_stat_categories))
+        sorted_stat_categories = sorted(all_stat_categories)
 
+        # Build each team's dataset once; the league-wide chart shares them
+        radar_datasets = []
         for team_name, team_data in players_by_team.items():
-            team_points_data = []
-            for category in sorted_stat_categories:
-                team_points_data.append(
-                    team_data["grouped_points_breakdown"].get(category, 0.0)
-                )
+            team_points = team_data["grouped_points_breakdown"]
+            dataset = {
+                "label": team_name,
+                "data": [
+                    team_points.get(category, 0.0)
+                    for category in sorted_stat_categories
+                ],
+            }
+            radar_datasets.append(dataset)
 
             team_data["radar_chart_data"] = {
                 "labels": sorted_stat_categories,
-                "datasets": [{"label": team_name, "data": team_points_data}],
+                "datasets": [dataset],
             }
 
+        final_radar_chart_data = {
+            "labels": sorted_stat_categories,
+            "datasets": radar_datasets,
+        }
+
         # Calculate team demographics for weekly report
         teams_with_data = []
         for team_name, team_data in players_by_team.items():
@@ -895,7 +1072,6 @@ class WeeklyReport:
         # --- Points Breakdown Refactored ---
 
         # Aggregate points by stat ID
-        stat_name_to_id_map = {v: k for k, v in PLAYER_STATS_MAP.items()}
         aggregated_points_by_id = {}
         for player in all_players:
             if player["team_abbrev"] == "FA" or player["slot_position"] == "BE" or player["slot_position"] == "IR":
@@ -903,7 +1079,7 @@ class WeeklyReport:
             if "points_breakdown" in player and player["points_breakdown"]:
                 for stat_name, points in player["points_breakdown"].items():
                     if isinstance(stat_name, str) and isinstance(points, (int, float)):
-                        stat_id = stat_name_to_id_map.get(stat_name)
+                        stat_id = _STAT_NAME_TO_ID.get(stat_name)
                         if stat_id:
                             aggregated_points_by_id[stat_id] = (
                                 aggregated_points_by_id.get(stat_id, 0.0) + points
@@ -945,28 +1121,6 @@ class WeeklyReport:
         # Sort the grouped data by category for consistent display
         sorted_grouped_points_breakdown = dict(sorted(grouped_points_breakdown.items()))
 
-        # Prepare data for radar charts
-        all_stat_categories = set()
-        for team_name, team_data in players_by_team.items():
-            all_stat_categories.update(team_data["grouped_points_breakdown"].keys())
-
-        sorted_stat_categories = sorted(list(all_stat_categories))
-
-        radar_datasets = []
-        for team_name, team_data in players_by_team.items():
-            team_points_data = []
-            for category in sorted_stat_categories:
-                team_points_data.append(
-                    team_data["grouped_points_breakdown"].get(category, 0.0)
-                )
-
-            radar_datasets.append({"label": team_name, "data": team_points_data})
-
-        final_radar_chart_data = {
-            "labels": sorted_stat_categories,
-            "datasets": radar_datasets,
-        }
-
         # Helper map for weekly scores to get logo and division easily
         team_info_map = {score['name']: score for score in weekly_scores}
 
@@ -1084,7 +1238,6 @@ class WeeklyReport:
 
         # --- Touchdowns Calculation ---
         scoring_format = self.data.league.settings.scoring_format
-        stat_name_to_id = {v: k for k, v in PLAYER_STATS_MAP.items()}
         stat_points_map = {}
         for item in scoring_format:
             stat_id = item['id']
@@ -1114,9 +1267,6 @@ class WeeklyReport:
             "ret": {"stats": ["defensive2PtReturns", "2PtReturns"], "icon": "🤯", "label": "Return"}
         }
 
-        # Helper map for weekly scores to get logo and division easily
-        team_info_map = {score['name']: score for score in weekly_scores}
-
         touchdown_standings = []
         two_point_conversions = []
 
@@ -1366,6 +1516,8 @@ class WeeklyReport:
                 "date": faked_date,
                 "attendance": faked_attendance,
             }
+        geocoder.flush()
+
         # Prepare template context
         context = {
             "year": self.year,
@@ -1405,33 +1557,16 @@ class WeeklyReport:
             "zodiac_pie_chart_data": zodiac_pie_chart_data,
             "touchdown_standings": touchdown_standings,
             "two_point_conversions": two_point_conversions,
-            "zodiac_names": {
-                "♈": "Aries",
-                "♉": "Taurus",
-                "♊": "Gemini",
-                "♋": "Cancer",
-                "♌": "Leo",
-                "♍": "Virgo",
-                "♎": "Libra",
-                "♏": "Scorpio",
-                "♐": "Sagittarius",
-                "♑": "Capricorn",
-                "♒": "Aquarius",
-                "♓": "Pisces",
-            },
+            "zodiac_names": ZODIAC_NAMES,
         }
 
-        # Render the template
-        html = self.template.render_weekly_report(context)
-
         # Determine output file path
         if output_file is None:
-            output_dir = "reports"
-            os.makedirs(output_dir, exist_ok=True)
-            output_file = os.path.join(output_dir, f"{self.year}-week{week}.html")
+            output_file = os.path.join(REPORTS_DIR, f"{self.year}-week{week}.html")
 
-        # Write the HTML to the file
-        with open(output_file, "w") as f:
-            f.write(html)
+        # Render the template straight to the file; the large buffer batches
+        # the streamed chunks into few writes
+        with open(output_file, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+            self.template.render_weekly_report_to(context, f)
 
         return output_file
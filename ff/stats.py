@@ -1,5 +1,8 @@
 """Fantasy football statistics calculations"""
 
+import heapq
+from dataclasses import dataclass, field
+
 
 def f_score(score):
     """Format a score to 2 decimal places
@@ -59,54 +62,88 @@ def max_score(lineup):
         else:
             positions[player.position] = [player.points]
 
-    # Sort points in each position (highest first)
-    for pos in positions:
-        positions[pos].sort(reverse=True)
+    return _max_from_positions(positions)
 
-    # Extract top scorers for each position
-    try:
-        max_qb = positions["QB"].pop(0) if "QB" in positions and positions["QB"] else 0
-        max_te = positions["TE"].pop(0) if "TE" in positions and positions["TE"] else 0
-        max_dst = (
-            positions["D/ST"].pop(0) if "D/ST" in positions and positions["D/ST"] else 0
-        )
-        max_k = positions["K"].pop(0) if "K" in positions and positions["K"] else 0
-        max_p = positions["P"].pop(0) if "P" in positions and positions["P"] else 0
-
-        # Get top 2 RBs and WRs
-        max_rb = sum(
-            [
-                positions["RB"].pop(0) if "RB" in positions and positions["RB"] else 0,
-                positions["RB"].pop(0) if "RB" in positions and positions["RB"] else 0,
-            ]
-        )
-        max_wr = sum(
-            [
-                positions["WR"].pop(0) if "WR" in positions and positions["WR"] else 0,
-                positions["WR"].pop(0) if "WR" in positions and positions["WR"] else 0,
-            ]
-        )
 
-        # Get flex (best of remaining RB/WR/TE)
-        max_flex = 0
-        if (
-            "WR" in positions
-            and positions["WR"]
-            and "RB" in positions
-            and positions["RB"]
-        ):
-            max_flex = max(positions["WR"].pop(0), positions["RB"].pop(0))
-        elif "WR" in positions and positions["WR"]:
-            max_flex = positions["WR"].pop(0)
-        elif "RB" in positions and positions["RB"]:
-            max_flex = positions["RB"].pop(0)
-
-        return round(
-            max_qb + max_te + max_dst + max_k + max_p + max_rb + max_wr + max_flex, 2
-        )
-    except Exception as e:
-        print(f"Error calculating max score: {e}")
-        return 0
+def _max_from_positions(positions):
+    """Calculate maximum possible score from points grouped by position
+
+    Args:
+        positions: Dictionary of position to list of player points
+
+    Returns:
+        Maximum possible score as a float
+    """
+
+    def top(pos, count):
+        return heapq.nlargest(count, positions.get(pos, ()))
+
+    # Top 2 RBs and WRs start; the third of each competes for flex
+    rbs = top("RB", 3)
+    wrs = top("WR", 3)
+
+    max_qb = sum(top("QB", 1))
+    max_te = sum(top("TE", 1))
+    max_dst = sum(top("D/ST", 1))
+    max_k = sum(top("K", 1))
+    max_p = sum(top("P", 1))
+    max_rb = sum(rbs[:2])
+    max_wr = sum(wrs[:2])
+
+    # Get flex (best of remaining RB/WR)
+    max_flex = max(wrs[2:] + rbs[2:], default=0)
+
+    return round(
+        max_qb + max_te + max_dst + max_k + max_p + max_rb + max_wr + max_flex, 2
+    )
+
+
+def lineup_stats(lineup):
+    """Calculate bench and maximum possible score for a lineup in one pass
+
+    Args:
+        lineup: List of players in a team's lineup
+
+    Returns:
+        Dictionary with "bench" and "max" scores
+    """
+    bench = 0
+    positions = {}
+    for player in lineup:
+        if player.slot_position == "BE":
+            bench += player.points
+        if player.position in positions:
+            positions[player.position].append(player.points)
+        else:
+            positions[player.position] = [player.points]
+
+    return {"bench": round(bench, 2), "max": _max_from_positions(positions)}
+
+
+def _box_score_stats(box_score):
+    """Calculate (home, away) lineup stats for each box score"""
+    return [
+        (lineup_stats(score.home_lineup), lineup_stats(score.away_lineup))
+        for score in box_score
+    ]
+
+
+@dataclass(slots=True)
+class PositionStat:
+    """Points summary for the players in one lineup position"""
+
+    position: str
+    points: float = 0
+    proj_points: float = 0
+    count: int = 0
+    point_arr: list = field(default_factory=list)
+    proj_arr: list = field(default_factory=list)
+    min: float = 0
+    max: float = 0
+    avg: float = 0
+    proj_min: float = 0
+    proj_max: float = 0
+    proj_avg: float = 0
 
 
 def points_per_player_per_position(lineup):
@@ -116,7 +153,7 @@ def points_per_player_per_position(lineup):
         lineup: List of players in a team's lineup
 
     Returns:
-        Dictionary containing position stats
+        Dictionary of position to PositionStat
     """
     pppp = {}
     for player in lineup:
@@ -124,47 +161,42 @@ def points_per_player_per_position(lineup):
         if player.slot_position == "BE":
             pos = pos + "-" + player.position
 
-        if pos in pppp:
-            pppp[pos]["points"] += player.points
-            pppp[pos]["point_arr"].append(player.points)
-            pppp[pos]["proj_points"] += player.projected_points
-            pppp[pos]["count"] += 1
-            pppp[pos]["min"] = min(pppp[pos]["min"], player.points)
-            pppp[pos]["max"] = max(pppp[pos]["max"], player.points)
-            pppp[pos]["avg"] = pppp[pos]["points"] / pppp[pos]["count"]
-
-            pppp[pos]["proj_min"] = min(pppp[pos]["proj_min"], player.projected_points)
-            pppp[pos]["proj_max"] = max(pppp[pos]["proj_max"], player.projected_points)
-            pppp[pos]["proj_avg"] = pppp[pos]["proj_points"] / pppp[pos]["count"]
-        else:
-            pppp[pos] = {
-                "points": player.points,
-                "point_arr": [player.points],
-                "proj_points": player.projected_points,
-                "position": pos,
-                "count": 1,
-                "min": player.points,
-                "max": player.points,
-                "avg": player.points,
-                "proj_min": player.projected_points,
-                "proj_max": player.projected_points,
-                "proj_avg": player.projected_points,
-            }
+        stats = pppp.get(pos)
+        if stats is None:
+            stats = pppp[pos] = PositionStat(position=pos)
+        stats.points += player.points
+        stats.proj_points += player.projected_points
+        stats.count += 1
+        stats.point_arr.append(player.points)
+        stats.proj_arr.append(player.projected_points)
+
+    # Derive the summary values once per position rather than per player
+    for stats in pppp.values():
+        stats.min = min(stats.point_arr)
+        stats.max = max(stats.point_arr)
+        stats.avg = stats.points / stats.count
+        stats.proj_min = min(stats.proj_arr)
+        stats.proj_max = max(stats.proj_arr)
+        stats.proj_avg = stats.proj_points / stats.count
 
     return pppp
 
 
-def calculate_weekly_scores(box_score):
+def calculate_weekly_scores(box_score, stats=None):
     """Calculate all team scores for the week
 
     Args:
         box_score: List of box score objects
+        stats: Precomputed (home, away) lineup stats per box score
 
     Returns:
         List of team score dictionaries
     """
+    if stats is None:
+        stats = _box_score_stats(box_score)
+
     scores = []
-    for score in box_score:
+    for score, (home_stats, away_stats) in zip(box_score, stats):
         scores.append(
             {
                 "score": score.home_score,
@@ -172,8 +204,8 @@ def calculate_weekly_scores(box_score):
                 "abbrev": score.home_team.team_abbrev,
                 "won": score.home_score > score.away_score,
                 "division": score.home_team.division_name[:1],
-                "bench_score": get_bench_score(score.home_lineup),
-                "max_score": max_score(score.home_lineup),
+                "bench_score": home_stats["bench"],
+                "max_score": home_stats["max"],
                 "lineup": score.home_lineup,
                 "logo": score.home_team.logo_url,
             }
@@ -185,8 +217,8 @@ def calculate_weekly_scores(box_score):
                 "abbrev": score.away_team.team_abbrev,
                 "won": score.away_score > score.home_score,
                 "division": score.away_team.division_name[:1],
-                "bench_score": get_bench_score(score.away_lineup),
-                "max_score": max_score(score.away_lineup),
+                "bench_score": away_stats["bench"],
+                "max_score": away_stats["max"],
                 "lineup": score.away_lineup,
                 "logo": score.away_team.logo_url,
             }
@@ -195,22 +227,26 @@ def calculate_weekly_scores(box_score):
     return scores
 
 
-def calculate_matchups(box_score):
+def calculate_matchups(box_score, stats=None):
     """Calculate matchup data for the week
 
     Args:
         box_score: List of box score objects
+        stats: Precomputed (home, away) lineup stats per box score
 
     Returns:
         List of matchup dictionaries
     """
+    if stats is None:
+        stats = _box_score_stats(box_score)
+
     matchups = []
-    for score in box_score:
-        home_max = max_score(score.home_lineup)
-        away_max = max_score(score.away_lineup)
+    for score, (home_stats, away_stats) in zip(box_score, stats):
+        home_max = home_stats["max"]
+        away_max = away_stats["max"]
 
-        home_bench = get_bench_score(score.home_lineup)
-        away_bench = get_bench_score(score.away_lineup)
+        home_bench = home_stats["bench"]
+        away_bench = away_stats["bench"]
 
         home_bench_outscored = home_bench > score.home_score
         away_bench_outscored = away_bench > score.away_score
@@ -260,6 +296,24 @@ def calculate_matchups(box_score):
     return matchups
 
 
+def calculate_week(box_score):
+    """Calculate matchups and team scores for the week
+
+    Lineup stats are computed once per team and shared by both results.
+
+    Args:
+        box_score: List of box score objects
+
+    Returns:
+        Tuple of (matchups, weekly_scores)
+    """
+    stats = _box_score_stats(box_score)
+    return (
+        calculate_matchups(box_score, stats),
+        calculate_weekly_scores(box_score, stats),
+    )
+
+
 def calculate_top_players(all_players):
     """Calculate top player stats for the week
 
@@ -1,10 +1,14 @@
 """HTML templates for fantasy football reports"""
 
 import os
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 from .config import DIV_IMAGES
 from .stats import f_score
 
+# Compiled templates are cached here between runs; entries are keyed on the
+# template source checksum, so edited templates are recompiled
+BYTECODE_CACHE_DIR = "cache/jinja"
+
 
 class TemplateEngine:
     """Handles HTML template rendering using Jinja2"""
@@ -13,9 +17,15 @@ class TemplateEngine:
         """Initialize the template engine with the templates directory"""
         # Create the templates directory if it doesn't exist
         os.makedirs("templates", exist_ok=True)
+        os.makedirs(BYTECODE_CACHE_DIR, exist_ok=True)
 
         # Initialize Jinja2 environment
-        self.env = Environment(loader=FileSystemLoader("templates"), autoescape=True)
+        self.env = Environment(
+            loader=FileSystemLoader("templates"),
+            autoescape=True,
+            bytecode_cache=FileSystemBytecodeCache(BYTECODE_CACHE_DIR),
+            auto_reload=False,
+        )
 
         # Add custom filters
         self.env.filters["format_score"] = f_score
@@ -51,3 +61,16 @@ class TemplateEngine:
         """
         template = self.env.get_template("weekly_report.jinja")
         return template.render(**context, div_images=DIV_IMAGES)
+
+    def render_weekly_report_to(self, context, fp):
+        """Render the weekly report template directly to a file
+
+        The template is streamed in chunks, so the full HTML is never held
+        in memory at once.
+
+        Args:
+            context: Dictionary of context variables for the template
+            fp: Writable text file object
+        """
+        template = self.env.get_template("weekly_report.jinja")
+        template.stream(**context, div_images=DIV_IMAGES).dump(fp)
@@ -1,12 +1,29 @@
+from geopy.extra.rate_limiter import RateLimiter
 from geopy.geocoders import Nominatim
 from geopy.location import Location
+from typing import Iterable
+import atexit
 import json
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 
 logger = logging.getLogger(__name__)
 
+OVERPASS_URL = "http://overpass-api.de/api/interpreter"
+
+_OVERPASS_STADIUM_QUERY = """
+[out:json];
+(
+  node["leisure"="stadium"](around:%(radius)s,%(lat)s,%(lon)s);
+  way["leisure"="stadium"](around:%(radius)s,%(lat)s,%(lon)s);
+  relation["leisure"="stadium"](around:%(radius)s,%(lat)s,%(lon)s);
+);
+out center;
+"""
+
 
 class Geocoder:
     def __init__(
@@ -16,6 +33,32 @@ class Geocoder:
         timeout=10,
     ):
         self.geolocator = Nominatim(user_agent=user_agent, timeout=timeout)
+        # Nominatim allows 1 request/s; these also retry transient errors
+        self._geocode = RateLimiter(
+            self.geolocator.geocode,
+            min_delay_seconds=1,
+            max_retries=2,
+            error_wait_seconds=5.0,
+        )
+        self._reverse = RateLimiter(
+            self.geolocator.reverse,
+            min_delay_seconds=1,
+            max_retries=2,
+            error_wait_seconds=5.0,
+        )
+        # Pooled session so repeated Overpass queries reuse the connection
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+            ),
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.forward_cache_file = self.cache_dir / "forward_cache.json"
@@ -24,6 +67,8 @@ class Geocoder:
         self.forward_cache = self._load_cache(self.forward_cache_file)
         self.reverse_cache = self._load_cache(self.reverse_cache_file)
         self.stadium_cache = self._load_cache(self.stadium_cache_file)
+        # Cache files with unsaved entries; written once by flush()
+        self._dirty = set()
 
     def _load_cache(self, cache_file: Path) -> dict:
         if cache_file.exists():
@@ -38,19 +83,57 @@ class Geocoder:
         with open(cache_file, "w") as f:
             json.dump(cache, f)
 
+    def _mark_dirty(self, cache_file: Path):
+        # Only hold an exit hook (and so a reference to this instance) while
+        # there are unsaved entries; flush() removes it again
+        if not self._dirty:
+            atexit.register(self.flush)
+        self._dirty.add(cache_file)
+
+    def flush(self):
+        """Write any caches with new entries back to disk"""
+        if not self._dirty:
+            return
+        atexit.unregister(self.flush)
+        caches = {
+            self.forward_cache_file: self.forward_cache,
+            self.reverse_cache_file: self.reverse_cache,
+            self.stadium_cache_file: self.stadium_cache,
+        }
+        for cache_file in self._dirty:
+            self._save_cache(caches[cache_file], cache_file)
+        self._dirty.clear()
+
     def geocode(self, address: str) -> Location:
         """Forward geocoding (address -> lat/lon)"""
         if address in self.forward_cache:
-            logger.debug(f"Geocode cache hit for address: {address}")
-            cached_data = self.forward_cache[address]
-            return Location(
-                cached_data["address"],
-                (cached_data["latitude"], cached_data["longitude"]),
-                cached_data["raw"],
-            )
+            return self._cached_geocode(address)
+        return self._lookup_geocode(address)
 
+    def geocode_many(self, addresses: Iterable[str]) -> dict[str, Location]:
+        """Forward geocode a batch of addresses.
+
+        Each distinct address is resolved once, and the cache is written once
+        at the end.
+        """
+        results = {}
+        for address in dict.fromkeys(addresses):
+            results[address] = self.geocode(address)
+        self.flush()
+        return results
+
+    def _cached_geocode(self, address: str) -> Location:
+        logger.debug(f"Geocode cache hit for address: {address}")
+        cached_data = self.forward_cache[address]
+        return Location(
+            cached_data["address"],
+            (cached_data["latitude"], cached_data["longitude"]),
+            cached_data["raw"],
+        )
+
+    def _lookup_geocode(self, address: str) -> Location:
         logger.info(f"Geocoding address: {address}")
-        location = self.geolocator.geocode(address)
+        location = self._geocode(address)
         if location:
             logger.info(
                 f"Geocoded {address} to {location.latitude}, {location.longitude}"
@@ -61,7 +144,7 @@ class Geocoder:
                 "longitude": location.longitude,
                 "raw": location.raw,  # Store raw data for full reconstruction
             }
-            self._save_cache(self.forward_cache, self.forward_cache_file)
+            self._mark_dirty(self.forward_cache_file)
         else:
             logger.warning(f"Could not geocode address: {address}")
         return location
@@ -81,7 +164,7 @@ class Geocoder:
             )
 
         logger.info(f"Reverse geocoding coordinates: {latitude}, {longitude}")
-        location = self.geolocator.reverse((latitude, longitude), language=language)
+        location = self._reverse((latitude, longitude), language=language)
         if location:
             logger.info(
                 f"Reverse geocoded {latitude}, {longitude} to {location.address}"
@@ -92,7 +175,7 @@ class Geocoder:
                 "longitude": location.longitude,
                 "raw": location.raw,
             }
-            self._save_cache(self.reverse_cache, self.reverse_cache_file)
+            self._mark_dirty(self.reverse_cache_file)
         else:
             logger.warning(
                 f"Could not reverse geocode coordinates: {latitude}, {longitude}"
@@ -111,25 +194,20 @@ class Geocoder:
         logger.info(
             f"Searching for stadiums around {latitude}, {longitude} with radius {radius}"
         )
-        overpass_url = "http://overpass-api.de/api/interpreter"
-        query = f"""
-[out:json];
-(
-  node["leisure"="stadium"](around:{radius},{latitude},{longitude});
-  way["leisure"="stadium"](around:{radius},{latitude},{longitude});
-  relation["leisure"="stadium"](around:{radius},{latitude},{longitude});
-);
-out center;
-"""
-        logger.info(query)
+        query = _OVERPASS_STADIUM_QUERY % {
+            "radius": radius,
+            "lat": latitude,
+            "lon": longitude,
+        }
+        logger.debug("Overpass query: %s", query)
 
         stadiums = []
+        fetched = False
         try:
-            response = requests.get(overpass_url, params={"data": query})
+            response = self._http.get(OVERPASS_URL, params={"data": query})
             response.raise_for_status()  # Raise an exception for HTTP errors
             data = response.json()
 
-            print(json.dumps(data, indent=4))
             for element in data["elements"]:
                 name = element["tags"].get("name", "Unnamed Stadium")
                 stadium_lat = (
@@ -144,6 +222,13 @@ out center;
                 )
                 stadiums.append({"name": name, "lat": stadium_lat, "lon": stadium_lon})
             logger.info(f"Found {len(stadiums)} stadiums: {[s['name'] for s in stadiums]}")
+            # Overpass reports timeouts and memory limits as a 200 with a
+            # remark (and usually no elements); don't cache those
+            remark = data.get("remark")
+            if remark:
+                logger.warning(f"Overpass query did not complete: {remark}")
+            else:
+                fetched = True
         except requests.exceptions.RequestException as e:
             logger.error(f"Error querying Overpass API: {e}")
         except json.JSONDecodeError:
@@ -151,7 +236,8 @@ out center;
         except Exception as e:
             logger.error(f"An unexpected error occurred while finding stadiums: {e}")
 
-        if stadiums: # Only cache if stadiums are found
+        # Cache any answer Overpass gave, including "no stadiums", but not failures
+        if fetched:
             self.stadium_cache[key] = stadiums
-            self._save_cache(self.stadium_cache, self.stadium_cache_file)
+            self._mark_dirty(self.stadium_cache_file)
         return stadiums